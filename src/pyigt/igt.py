@@ -1,10 +1,13 @@
 import re
+import sys
 import enum
 import json
 import types
 import shutil
 import typing
 import pathlib
+import operator
+import functools
 import tempfile
 import itertools
 import collections
@@ -13,7 +16,7 @@ import unicodedata
 from tabulate import tabulate
 import segments
 import attr
-from csvw.dsv import UnicodeWriter, reader
+from csvw.dsv import UnicodeWriter, UnicodeReader, reader
 from csvw.metadata import Link
 from pycldf import Dataset
 from pycldf import orm
@@ -32,6 +35,16 @@ from pyigt.lgrmorphemes import (
 __all__ = ['IGT', 'Corpus', 'LGRConformance', 'Example']
 
 NON_OVERT_ELEMENT = '∅'
+# LGR Rule 2A: Morphemes separated by " -" are attached to the preceding word. Thus, a word is a
+# run of non-whitespace, possibly continued by " -" and more non-whitespace. A dangling " -",
+# i.e. followed by whitespace or the end of the phrase, is attached to the preceding word, too.
+RULE_2A_WORD_PATTERN = re.compile(r'\S+(?: -\S+)*(?: -(?!\S))?')
+# Abbreviations explained in the translation, e.g. "(CONN = connective)".
+ABBRS_PATTERN = re.compile(r'\((?P<abbrs>((\s*,\s*)?[A-Z][A-Z0-9]*\s*=\s*[^,)]+)+)\)')
+# Concepts marked with a dagger, e.g. "†(old)".
+DAGGER_PATTERN = re.compile(r'†\(([^)]+)\)')
+# Formats a (igt, word, morpheme) reference to a morpheme in a corpus as "igt:word:morpheme".
+_format_ref = '{}:{}:{}'.format
 
 
 def with_lingpy():
@@ -63,12 +76,20 @@ def parse_phrase(p):
     preceding word.
     """
     if isinstance(p, str):
-        rule2a = re.compile(r'([^\s]+) -')
-        return [
-            w.replace('|||', ' ') for w in rule2a.sub(lambda m: m.groups()[0] + '|||-', p).split()]
+        return RULE_2A_WORD_PATTERN.findall(p)
     return p
 
 
+def _reset_cached_properties(igt, _, value):
+    """
+    `on_setattr` hook, discarding the cached properties of an `IGT` when one of the attributes
+    they depend on is re-assigned.
+    """
+    for name in _IGT_CACHED_PROPERTIES:
+        igt.__dict__.pop(name, None)
+    return value
+
+
 @attr.s
 class IGT(object):
     """
@@ -90,6 +111,13 @@ class IGT(object):
     :ivar strict: `bool` flag signaling whether to parse the `IGT` in strict mode, i.e. requiring \
     matching morpheme separators in phrase and gloss, or not.
 
+    .. note::
+
+        Derived properties like :meth:`IGT.glossed_words` or :meth:`IGT.conformance` are computed
+        on first access and cached. Re-assigning `phrase`, `gloss`, `abbrs` or `strict` discards
+        these cached values, but modifying them in-place (e.g. `igt.gloss.append(...)`) is not
+        detected. So `IGT` instances should be treated as immutable.
+
     .. note::
 
         **LGR Conformance**
@@ -127,27 +155,34 @@ class IGT(object):
     phrase = attr.ib(
         validator=attr.validators.instance_of(list),
         converter=parse_phrase,
+        on_setattr=_reset_cached_properties,
     )
     gloss = attr.ib(
         validator=attr.validators.instance_of(list),
         converter=lambda g: g.split() if isinstance(g, str) else g,
+        on_setattr=_reset_cached_properties,
     )
     id = attr.ib(default=None)
     properties = attr.ib(validator=attr.validators.instance_of(dict), default=attr.Factory(dict))
     language = attr.ib(default=None)
     translation = attr.ib(default=None)
-    abbrs = attr.ib(validator=attr.validators.instance_of(dict), default=attr.Factory(dict))
-    strict = attr.ib(default=False)
+    abbrs = attr.ib(
+        validator=attr.validators.instance_of(dict),
+        default=attr.Factory(dict),
+        on_setattr=_reset_cached_properties,
+    )
+    strict = attr.ib(default=False, on_setattr=_reset_cached_properties)
 
     def __attrs_post_init__(self):
         if self.translation:
-            p = re.compile(r'\((?P<abbrs>((\s*,\s*)?[A-Z][A-Z0-9]*\s*=\s*[^,)]+)+)\)')
-            abbrs = p.search(self.translation)
-            if abbrs:
-                for abbr in abbrs.group('abbrs').split(','):
-                    abbr, _, label = abbr.partition('=')
-                    self.abbrs[abbr.strip()] = label.strip()
-                self.translation = p.sub('', self.translation).strip()
+            # Most translations do not explain abbreviations, so we only search if they might.
+            if '(' in self.translation and '=' in self.translation:
+                abbrs = ABBRS_PATTERN.search(self.translation)
+                if abbrs:
+                    for abbr in abbrs.group('abbrs').split(','):
+                        abbr, _, label = abbr.partition('=')
+                        self.abbrs[abbr.strip()] = label.strip()
+                    self.translation = ABBRS_PATTERN.sub('', self.translation).strip()
             if self.translation[0] == "'" or unicodedata.category(self.translation[0]) == 'Pi':
                 # Punctuation, Initial quote
                 self.translation = self.translation[1:].strip()
@@ -162,8 +197,16 @@ class IGT(object):
     def __iter__(self):
         yield from self.glossed_words
 
-    @property
+    @functools.cached_property
     def glossed_words(self) -> typing.List[GlossedWord]:
+        """
+        The aligned (word, gloss) pairs of the IGT.
+
+        .. note::
+
+            The list is computed on first access and cached, thus `phrase` and `gloss` of an `IGT`
+            should not be changed in-place after initialization.
+        """
         return [GlossedWord(w, g, strict=self.strict) for w, g in zip(self.phrase, self.gloss)]
 
     @property
@@ -179,19 +222,28 @@ class IGT(object):
         """
         res = []
         for w, g in zip(self.phrase, self.gloss):
-            word, gloss = '', ''
+            # We need the (memoized) morpheme split of every word, to check its alignment.
             morphemes = split_morphemes(w)
             morpheme_glosses = split_morphemes(g)
+            if w and ' -' not in w and len(morphemes) == len(morpheme_glosses):
+                # Without prosodically free elements, an aligned word is a prosodic word as is, so
+                # we don't need to re-join its morphemes.
+                res.append(GlossedWord(w, g, strict=self.strict))
+                continue
+            # We collect the parts of the current word and gloss, to join them only once.
+            word, gloss = [], []
             for wm, gm in zip(morphemes, morpheme_glosses):
-                if wm == '-' and word and word[-1] == ' ':
+                if wm == '-' and word and word[-1].endswith(' '):
                     assert gm == '-'
-                    res.append(GlossedWord(word.strip(), gloss, strict=self.strict))
-                    word, gloss = '', ''
+                    res.append(
+                        GlossedWord(''.join(word).strip(), ''.join(gloss), strict=self.strict))
+                    word, gloss = [], []
                 else:
-                    word += wm
-                    gloss += gm
+                    word.append(wm)
+                    gloss.append(gm)
+            word = ''.join(word)
             if word:
-                res.append(GlossedWord(word, gloss, strict=self.strict))
+                res.append(GlossedWord(word, ''.join(gloss), strict=self.strict))
         return res
 
     @property
@@ -205,12 +257,10 @@ class IGT(object):
         Use :meth:`IGT.as_morphosyntactic` to get an `IGT` instance initialised from the
         morphosyntactic words of an `IGT` instance.
         """
-        res = []
-        for w, g in zip(self.phrase, self.gloss):
-            res.extend([
-                GlossedWord(ww, gg, strict=self.strict)
-                for ww, gg in zip(w.split('='), g.split('='))])
-        return res
+        return [
+            GlossedWord(ww, gg, strict=self.strict)
+            for w, g in zip(self.phrase, self.gloss)
+            for ww, gg in zip(w.split('='), g.split('='))]
 
     def as_prosodic(self) -> 'IGT':
         """
@@ -225,16 +275,7 @@ class IGT(object):
             >>> igt.as_prosodic()[0].word
             'a=bcd'
         """
-        return IGT(
-            phrase=[gw.word for gw in self.prosodic_words],
-            gloss=[gw.gloss for gw in self.prosodic_words],
-            id=self.id,
-            properties=self.properties,
-            language=self.language,
-            translation=self.translation,
-            abbrs=self.abbrs,
-            strict=self.strict,
-        )
+        return self._from_glossed_words(self.prosodic_words)
 
     def as_morphosyntactic(self):
         """
@@ -249,29 +290,43 @@ class IGT(object):
             >>> igt.as_morphosyntactic()[-1].word
             'bcd -e'
         """
-        return IGT(
-            phrase=[gw.word for gw in self.morphosyntactic_words],
-            gloss=[gw.gloss for gw in self.morphosyntactic_words],
+        return self._from_glossed_words(self.morphosyntactic_words)
+
+    def _from_glossed_words(self, glossed_words: typing.List[GlossedWord]) -> 'IGT':
+        """
+        Create an `IGT` with the same metadata but a different segmentation into glossed words.
+        """
+        igt = IGT(
+            phrase=[gw.word for gw in glossed_words],
+            gloss=[gw.gloss for gw in glossed_words],
             id=self.id,
             properties=self.properties,
             language=self.language,
-            translation=self.translation,
             abbrs=self.abbrs,
             strict=self.strict,
         )
+        # The translation has already been cleaned up when initializing `self`:
+        igt.translation = self.translation
+        # The glossed words are exactly what would be computed from phrase and gloss:
+        igt.__dict__['glossed_words'] = glossed_words
+        return igt
 
-    @property
-    def gloss_abbrs(self) -> collections.OrderedDict:
-        res = collections.OrderedDict()
+    @functools.cached_property
+    def gloss_abbrs(self) -> typing.Dict[str, typing.Optional[str]]:
+        """
+        Maps category labels used in the gloss to their descriptions (or `None`, if no description
+        is available). Computed on first access and cached.
+        """
+        res = {}
         for gw in self.glossed_words:
             for gm in gw:
                 for element in gm.gloss.elements:
-                    # We disregard "I".
-                    if element != 'I' and element.is_category_label:
+                    # We disregard "I" and labels we have already looked up.
+                    if element != 'I' and element not in res and element.is_category_label:
                         if element in self.abbrs:
                             res[element] = self.abbrs[element]
                         else:
-                            desc = expand_standard_abbr(element)
+                            desc = expand_standard_abbr(str(element))
                             res[element] = desc if desc != element else None
         return res
 
@@ -324,23 +379,33 @@ class IGT(object):
             return word[i[1]]
         return self.glossed_words[i]
 
-    @property
+    @functools.cached_property
     def conformance(self) -> LGRConformance:
         """
         Alignment level of the `IGT`.
+
+        .. note::
+
+            The conformance level is computed on first access and cached.
         """
-        if self.is_valid(strict=True):
-            return LGRConformance.MORPHEME_ALIGNED
-        if self.is_valid():
+        if len(self.phrase) != len(self.gloss):  # Rule 1 violated.
+            return LGRConformance.UNALIGNED
+        try:
+            glossed_words = [
+                GlossedWord(w, g, strict=True) for w, g in zip(self.phrase, self.gloss)]
+        except (ValueError, AssertionError):  # Rule 2 violated.
             return LGRConformance.WORD_ALIGNED
-        return LGRConformance.UNALIGNED
+        if 'glossed_words' not in self.__dict__:
+            # Morpheme-aligned words are parsed the same way in strict and non-strict mode, so we
+            # can fill the cache of `IGT.glossed_words`.
+            for gw in glossed_words:
+                gw.strict = self.strict
+            self.__dict__['glossed_words'] = glossed_words
+        return LGRConformance.MORPHEME_ALIGNED
 
     def is_valid(self, strict: bool = False) -> bool:
-        try:
-            self.check(strict=strict)
-            return True
-        except (ValueError, AssertionError):
-            return False
+        return self.conformance >= (
+            LGRConformance.MORPHEME_ALIGNED if strict else LGRConformance.WORD_ALIGNED)
 
     def check(self, strict: bool = False, verbose: bool = False):
         """
@@ -353,7 +418,9 @@ class IGT(object):
                 print('\t'.join(self.gloss))
             raise ValueError(
                 'Rule 1 violated: Number of words does not match number of word glosses!')
-        if strict:
+        # The (cached) conformance level tells us whether all words can be parsed strictly, so we
+        # only need to look at individual words to report an error.
+        if strict and self.conformance != LGRConformance.MORPHEME_ALIGNED:
             for i, (m, g) in enumerate(zip(self.phrase, self.gloss)):
                 try:
                     GlossedWord(m, g, strict=True)
@@ -365,14 +432,19 @@ class IGT(object):
                         'Rule 2 violated: Number of morphemes does not match number of morpheme '
                         'glosses!')
 
-    @property
+    @functools.cached_property
     def phrase_text(self) -> str:
         return ' '.join([w or '' for w in self.phrase])
 
-    @property
+    @functools.cached_property
     def primary_text(self) -> str:
         """
         The primary text of the `IGT`, i.e. the phrase stripped off morpheme separators.
+
+        .. note::
+
+            Like `phrase_text` and `gloss_text`, the primary text is computed on first access and
+            cached.
         """
         if self.conformance == LGRConformance.MORPHEME_ALIGNED:
             words = []
@@ -381,11 +453,16 @@ class IGT(object):
             return ' '.join(words)
         return remove_morpheme_separators(self.phrase_text)
 
-    @property
+    @functools.cached_property
     def gloss_text(self) -> str:
         return ' '.join(self.gloss)
 
 
+# The names of all cached properties of `IGT`, to be reset by `_reset_cached_properties`.
+_IGT_CACHED_PROPERTIES = [
+    n for n, v in vars(IGT).items() if isinstance(v, functools.cached_property)]
+
+
 class Example(orm.Example):
     """
     A custom object class to use with
@@ -422,9 +499,11 @@ class Example(orm.Example):
         )
 
 
+@functools.lru_cache(maxsize=4096)
 def _clean_lexical_concept(s):
-    s = re.sub(r'†\(([^)]+)\)', lambda m: m.groups()[0], s)
-    return s.replace('†', '').strip()
+    if '†' not in s:
+        return s.strip()
+    return DAGGER_PATTERN.sub(r'\1', s).replace('†', '').strip()
 
 
 class Corpus(object):
@@ -439,7 +518,9 @@ class Corpus(object):
     def __init__(self, igts: typing.Iterable[IGT], fname=None, clean_lexical_concept=None):
         self.clean_lexical_concept = clean_lexical_concept or _clean_lexical_concept
         self.fname = fname
-        self._igts = collections.OrderedDict([(igt.id or n, igt) for n, igt in enumerate(igts)])
+        self._igts = {igt.id or n: igt for n, igt in enumerate(igts)}
+        # For positional access, we keep the IGTs in a list as well:
+        self._igt_list = list(self._igts.values())
         self._concordance = dict(
             grammar=collections.defaultdict(list),
             lexicon=collections.defaultdict(list),
@@ -447,20 +528,33 @@ class Corpus(object):
         )
         # Since changing the IGTs in the corpus is not allowed, we can compute concordances right
         # away.
+        grammar, lexicon, forms = \
+            self._concordance['grammar'], self._concordance['lexicon'], self._concordance['form']
+        # We also keep a flat lookup of the morphemes referenced in the concordances:
+        self._morphemes = morphemes = {}
+        # ... and check whether all IGTs are in the same language.
+        languages = set()
         for idx, igt in self._igts.items():
-            if not igt.is_valid(strict=True):  # We ignore non-morpheme-aligned IGTs.
-                continue
+            if len(languages) < 2:
+                languages.add(igt.language)
+            # Note: Checking conformance first allows re-using the glossed words created for the
+            # check.
+            if igt.conformance != LGRConformance.MORPHEME_ALIGNED:
+                continue  # We ignore non-morpheme-aligned IGTs.
             for i, gw in enumerate(igt):
                 for j, gm in enumerate(gw):
-                    if not gm.form:
+                    form = gm.form
+                    if not form:
                         continue
 
                     ref = (idx, i, j)
-                    for g in gm.grammatical_concepts:
-                        self._concordance['grammar'][g].append(ref)
-                    self._concordance['lexicon'][' // '.join(gm.lexical_concepts)].append(ref)
-                    self._concordance['form'][gm.form].append(ref)
-        self.monolingual = len(set(igt.language for igt in self._igts.values())) == 1
+                    morphemes[ref] = gm
+                    grammatical_concepts, lexical_concepts = gm.concepts
+                    for g in grammatical_concepts:
+                        grammar[g].append(ref)
+                    lexicon[' // '.join(lexical_concepts)].append(ref)
+                    forms[form].append(ref)
+        self.monolingual = len(languages) == 1
 
     @property
     def grammar(self) -> typing.Dict[str, typing.List[typing.Tuple[int, int, int]]]:
@@ -555,7 +649,8 @@ class Corpus(object):
         cldf.add_component('ExampleTable')
 
         cols = cls.get_column_names(cldf)
-        igts = [
+        # We read the stream lazily, creating IGTs one row at a time.
+        return cls(
             IGT(
                 id=igt[cols.id],
                 gloss=igt[cols.gloss].split('\\t'),
@@ -563,8 +658,7 @@ class Corpus(object):
                 language=igt.get(cols.language),
                 properties=igt,
             )
-            for igt in reader(stream.read().splitlines(), dicts=True)]
-        return cls(igts)
+            for igt in reader(stream, dicts=True))
 
     @classmethod
     def from_path(cls, path: typing.Union[str, pathlib.Path]) -> 'Corpus':
@@ -580,18 +674,19 @@ class Corpus(object):
         if path.suffix == '.json':
             return cls.from_cldf(Dataset.from_metadata(path))
         # We are given only an ExampleTable. Let's create the appropriate dataset:
-        header = None
-        for d in reader(path, dicts=True):
-            header = list(d.keys())
-            break
+        # We only need the header row, so we read just that and close the file right away.
+        with UnicodeReader(path) as r:
+            header = next(r, None)
         ds = Dataset.from_metadata(
             pathlib.Path(pycldf.__file__).parent / 'modules' / 'Generic-metadata.json')
         ds.tablegroup._fname = path.parent / 'cldf-metadata.json'
         t = ds.add_component('ExampleTable')
         t.url = Link(path.name)
         default_cols = [col.name for col in t.tableSchema.columns]
-        ds.remove_columns(t, *list(set(default_cols) - set(header)))
-        ds.add_columns(t, *list(set(header) - set(default_cols)))
+        # We keep the column order deterministic, following the default columns and the header:
+        header_cols, default_col_set = set(header), set(default_cols)
+        ds.remove_columns(t, *[c for c in default_cols if c not in header_cols])
+        ds.add_columns(t, *[c for c in header if c not in default_col_set])
         return cls.from_cldf(ds)
 
     def __len__(self):
@@ -602,12 +697,21 @@ class Corpus(object):
 
     def __getitem__(self, item):
         if not isinstance(item, tuple):
-            return self._igts[item] if item in self._igts else list(self._igts.values())[item]
+            return self._igts[item] if item in self._igts else self._igt_list[item]
         if len(item) == 2:
             return self._igts[item[0]][item[1]]
         return self[item[0]][tuple(item[1:])]
 
-    def get_stats(self):
+    def get_stats(self) -> typing.Tuple[int, int, int]:
+        """
+        :return: Triple (number of IGTs, number of words, number of morphemes) of the corpus.
+        """
+        return self._stats
+
+    @functools.cached_property
+    def _stats(self) -> typing.Tuple[int, int, int]:
+        # Counting words and morphemes requires the glossed words of all IGTs - which may not be
+        # computable for IGTs that aren't morpheme-aligned - so we only do it on demand, but once.
         return (
             len(self),
             sum(len(igt) for igt in self),
@@ -621,69 +725,73 @@ class Corpus(object):
         :param ctype: `lexicon` or `grammar` or `form`.
         """
         conc = collections.defaultdict(list)
-        for c, refs in getattr(self, ctype).items():
-            for ref in refs:
-                # We want one row per unique (form, language, concept, gloss).
-                if ctype == 'form':
-                    gloss = str(self[ref].gloss)
-                    conc[c, gloss, gloss, self[ref[0]].language].append(ref)
-                else:
-                    conc[
-                        self[ref].form,
-                        self.clean_lexical_concept(c),
-                        c,
-                        self[ref[0]].language].append(ref)
-
-        with UnicodeWriter(filename, delimiter='\t') as w:
+        igts, morphemes = self._igts, self._morphemes
+        # We want one row per unique (form, language, concept, gloss).
+        if ctype == 'form':
+            for c, refs in self.form.items():
+                for ref in refs:
+                    gloss = str(morphemes[ref].gloss)
+                    conc[c, gloss, gloss, igts[ref[0]].language].append(ref)
+        else:
+            for c, refs in getattr(self, ctype).items():
+                # The cleaned concept only depends on the concept, not on the occurrence:
+                concept = self.clean_lexical_concept(c)
+                for ref in refs:
+                    conc[morphemes[ref].form, concept, c, igts[ref[0]].language].append(ref)
+
+        # Without filename, we write to stdout directly rather than buffering the output.
+        with UnicodeWriter(filename or sys.stdout, delimiter='\t') as w:
             h = ['ID', 'FORM', 'GLOSS', 'GLOSS_IN_SOURCE', 'OCCURRENCE', 'REF']
             if not self.monolingual:
                 h.insert(1, 'LANGUAGE_ID')
             w.writerow(h)
-            # We order the rows by descending frequency:
-            for i, (k, refs) in enumerate(
-                    sorted(conc.items(), key=lambda x: (-len(x[1]), x[0])), start=1):
+            # We order the rows by descending frequency - sorting decorated tuples rather than
+            # calling a key function for each item:
+            items = [(-len(refs), k, refs) for k, refs in conc.items()]
+            items.sort()
+            # Rows are written one by one, so we don't keep a second copy of the data in memory.
+            for i, (_, k, refs) in enumerate(items, start=1):
                 c = [
                     i,
                     k[0],
                     k[1],
                     k[2],
                     len(refs),
-                    ' '.join(['{}:{}:{}'.format(*ref) for ref in refs])]
+                    ' '.join(itertools.starmap(_format_ref, refs))]
                 if not self.monolingual:
                     c.insert(1, k[3])
                 w.writerow(c)
 
-        if not filename:
-            print(w.read().decode('utf8'))
-
     def write_concepts(self, ctype, filename=None):
         """
         :param ctype: `lexicon` or `grammar`.
         """
-        def form(ref):
-            return self[ref].form if self.monolingual else '{}: {}'.format(
-                self[ref[0]].language, self[ref].form)
-
         conc = []
         for c, refs in getattr(self, ctype).items():
             if c:
-                igt = self[refs[0][0]]
+                igt = self._igts[refs[0][0]]
+                # Collect the distinct glosses and forms in one pass over the occurrences:
+                glosses, forms = set(), set()
+                for ref in refs:
+                    gm = self._morphemes[ref]
+                    glosses.add(str(gm.gloss))
+                    forms.add(gm.form if self.monolingual else '{}: {}'.format(
+                        self._igts[ref[0]].language, gm.form))
                 conc.append([
                     self.clean_lexical_concept(c),
                     len(refs),
-                    ' // '.join(sorted(set(str(self[ref].gloss) for ref in refs))),
-                    ' // '.join(sorted(set(form(ref) for ref in refs))),
+                    ' // '.join(sorted(glosses)),
+                    ' // '.join(sorted(forms)),
                     igt.phrase_text,
                     igt.gloss_text,
                 ])
 
-        with UnicodeWriter(filename, delimiter='\t') as w:
+        # Without filename, we write to stdout directly rather than buffering the output.
+        with UnicodeWriter(filename or sys.stdout, delimiter='\t') as w:
             w.writerow(
                 ['ID', 'ENGLISH', 'OCCURRENCE', 'CONCEPT_IN_SOURCE', 'FORMS', 'PHRASE', 'GLOSS'])
-            for i, row in enumerate(sorted(conc, key=lambda x: -x[1]), start=1):
-                w.writerow([i] + row)
-        if not filename:
-            print(w.read().decode('utf8'))
+            w.writerows(
+                [i] + row for i, row in enumerate(sorted(conc, key=lambda x: -x[1]), start=1))
 
     def check_glosses(self, level=2):
         count = 1
@@ -694,7 +802,8 @@ class Corpus(object):
                 print(igt.gloss)
                 print('---')
                 count += 1
-            if level >= 2:
+            # Only IGTs which are not morpheme-aligned can have words failing the strict check:
+            if level >= 2 and igt.conformance != LGRConformance.MORPHEME_ALIGNED:
                 for i, (w, m) in enumerate(zip(igt.phrase, igt.gloss), start=1):
                     try:
                         GlossedWord(w, m, strict=True)
@@ -739,29 +848,37 @@ class Corpus(object):
         }
         idx = 1
         # Iterate over unique (cleaned concept, form, language, gloss) tuples.
+        igts, morphemes = self._igts, self._morphemes
         i = 0
         for form, refs in self.form.items():
-            for (lid, gloss), morphrefs in itertools.groupby(
-                sorted(refs, key=lambda r: (self[r[0]].language, str(self[r].gloss))),
-                lambda r: (self[r[0]].language, str(self[r].gloss))
-            ):
-                morphrefs = list(morphrefs)
-                gm = self[morphrefs[0]]
-                gw = self[morphrefs[0][:2]]
-                igt = self[morphrefs[0][0]]
+            # Tokenization only depends on the form, so we do it once per form:
+            tokens = tokenize(form)
+            # check tokens
+            try:
+                with_lingpy().tokens2class(tokens, 'sca')
+                check = True
+            except:  # noqa: E722, # pragma: no cover
+                check = False
+            # We compute the (language, gloss) key for each reference only once, for sorting and
+            # grouping:
+            keyed = [((igts[r[0]].language, str(morphemes[r].gloss)), r) for r in refs]
+            keyed.sort(key=operator.itemgetter(0))
+            for (lid, gloss), items in itertools.groupby(keyed, operator.itemgetter(0)):
+                morphrefs = [r for _, r in items]
+                gm = morphemes[morphrefs[0]]
+                igt = igts[morphrefs[0][0]]
+                gw = igt[morphrefs[0][1]]
                 i += 1
+                grammatical_concepts, lexical_concepts = gm.concepts
                 concepts = \
-                    list(itertools.zip_longest(gm.lexical_concepts, [], fillvalue='lexicon')) + \
-                    list(itertools.zip_longest(gm.grammatical_concepts, [], fillvalue='grammar'))
+                    list(itertools.zip_longest(lexical_concepts, [], fillvalue='lexicon')) + \
+                    list(itertools.zip_longest(grammatical_concepts, [], fillvalue='grammar'))
+                # These values are the same for all concepts of the morpheme:
+                word_forms = ' '.join(m.form for m in gw)
+                gloss_forms = ' '.join(m.gloss for m in gw)
+                references = ' '.join(itertools.starmap(_format_ref, morphrefs))
                 for concept, ctype in concepts:
                     concept = self.clean_lexical_concept(concept)
-                    tokens = tokenize(form)
-                    # check tokens
-                    try:
-                        with_lingpy().tokens2class(tokens, 'sca')
-                        check = True
-                    except:  # noqa: E722, # pragma: no cover
-                        check = False
                     if concept.strip() and check:
                         D[idx] = [
                             doculect if self.monolingual else lid,
@@ -769,13 +886,13 @@ class Corpus(object):
                             gloss,
                             ctype,
                             form,
-                            tokens,
+                            list(tokens),  # Each row gets its own copy of the tokens.
                             len(morphrefs),
-                            ' '.join(m.form for m in gw),
-                            ' '.join(m.gloss for m in gw),
+                            word_forms,
+                            gloss_forms,
                             igt.phrase_text,
                             igt.gloss_text,
-                            ' '.join('{}:{}:{}'.format(*ref) for ref in morphrefs)]
+                            references]
                         idx += 1
                     else:
                         print('[!] Problem with "{0}" / [{1}] [{2}] / {3} {4} {5}'.format(
@@ -801,7 +918,7 @@ class Corpus(object):
 
         D = {0: ['doculect', 'concept', 'ipa']}
         for i, key in enumerate(self.form, start=1):
-            D[i] = ['dummy', str(self[self.form[key][0]].gloss), key]
+            D[i] = ['dummy', str(self._morphemes[self.form[key][0]].gloss), key]
         wordlist = with_lingpy().basic.wordlist.Wordlist(D)
 
         if not filename:
@@ -813,9 +930,10 @@ class Corpus(object):
 
         with UnicodeWriter(p, delimiter='\t') as w:
             w.writerow(['Grapheme', 'IPA', 'Example', 'Count', 'Unicode'])
-            for line in with_lingpy().sequence.profile.context_profile(
-                    wordlist, ref='ipa', clts=clts):
-                w.writerow([line[0], line[1], line[2], line[4], line[5]])
+            w.writerows(
+                [line[0], line[1], line[2], line[4], line[5]]
+                for line in with_lingpy().sequence.profile.context_profile(
+                    wordlist, ref='ipa', clts=clts))
 
         res = segments.Profile.from_file(p)
         if not filename:
@@ -827,27 +945,33 @@ class Corpus(object):
         # concordance 0 is phrase, 1 is gloss
 
         wordlist = self.get_wordlist()
-        WL, CN = collections.OrderedDict(), collections.OrderedDict()
+        WL, CN = {}, {}
         for idx, form, concept, refs in wordlist.iter_rows('form', 'concept', 'references'):
             WL[idx] = [
                 form,
                 concept,
-                [[int(y) for y in x.split(':')] for x in refs.split()],
+                [list(map(int, x.split(':'))) for x in refs.split()],
                 wordlist[idx, 'tokens'],
             ]
 
             for line in WL[idx][2]:
-                igt = self[str(line[0])]
-                CN[line[0]] = [
-                    igt.phrase,
-                    igt.gloss,
-                ]
-                # FIXME: must add additional IGT data from ExampleTable row!
+                # Many references point to the same IGT, which we only need to add once.
+                if line[0] not in CN:
+                    igt = self[str(line[0])]
+                    CN[line[0]] = [
+                        igt.phrase,
+                        igt.gloss,
+                    ]
+                    # FIXME: must add additional IGT data from ExampleTable row!
         dest = pathlib.Path(dest)
         assert dest.is_dir()
         with dest.joinpath('script.js').open('w', encoding='utf8') as f:
-            f.write('var WORDLIST = ' + json.dumps(WL, indent=2) + ';\n')
-            f.write('var CONC = ' + json.dumps(CN, indent=2) + ';\n')
+            # We stream the JSON data to the file, rather than serializing it to a string first.
+            f.write('var WORDLIST = ')
+            json.dump(WL, f, indent=2)
+            f.write(';\nvar CONC = ')
+            json.dump(CN, f, indent=2)
+            f.write(';\n')
         index = dest / 'index.html'
         if not index.exists():
             shutil.copy(str(pathlib.Path(__file__).parent.joinpath('index.html')), str(index))
@@ -12,6 +12,7 @@ The provisions of Rule 4 (and following), i.e. the structure of morpheme glosses
 as subclasses of :class:`GlossElement`.
 """
 import re
+import functools
 import itertools
 import typing
 import unicodedata
@@ -36,12 +37,43 @@ MORPHEME_SEPARATORS = [
 ]
 
 
+class _MarkupTable(dict):
+    """
+    Translation table for `str.translate`, deleting sentence-level markup (i.e. punctuation etc.).
+
+    Characters are classified lazily, i.e. `unicodedata.category` is called only once per
+    distinct character.
+    """
+    categories = {'Po', 'Pf', 'Ps', 'Pd', 'Pe', 'Pi', 'Sm'}
+
+    def __missing__(self, codepoint):
+        res = None if unicodedata.category(chr(codepoint)) in self.categories else codepoint
+        self[codepoint] = res
+        return res
+
+
+_MARKUP_TABLE = _MarkupTable()
+
+
+_MORPHEME_SEPARATOR_SET = frozenset(MORPHEME_SEPARATORS)
+MORPHEME_SEPARATORS_PATTERN = re.compile(
+    '([{}])'.format(re.escape(''.join(MORPHEME_SEPARATORS))))
+# Translation table for `str.translate`, deleting morpheme separators.
+_MORPHEME_SEPARATORS_TABLE = str.maketrans('', '', ''.join(MORPHEME_SEPARATORS))
+
+
+@functools.lru_cache(maxsize=4096)
+def _split_morphemes(s: str) -> typing.Tuple[str, ...]:
+    # Words and glosses recur frequently in a corpus, so we memoize the (immutable) split results.
+    return tuple(MORPHEME_SEPARATORS_PATTERN.split(s))
+
+
 def split_morphemes(s):
-    return re.split('({})'.format('|'.join(re.escape(c) for c in MORPHEME_SEPARATORS)), s or '')
+    return list(_split_morphemes(s or ''))
 
 
 def remove_morpheme_separators(s):
-    return ''.join(ss for ss in split_morphemes(s) if ss not in MORPHEME_SEPARATORS)
+    return (s or '').translate(_MORPHEME_SEPARATORS_TABLE)
 
 
 class GlossElement(str):
@@ -72,7 +104,8 @@ class GlossElement(str):
 
     @property
     def is_category_label(self):
-        return is_generic_abbr(self)
+        # We pass a plain `str`, to not keep `GlossElement` objects alive in the lookup cache.
+        return is_generic_abbr(str(self))
 
 
 class Infix(GlossElement, str):
@@ -130,6 +163,22 @@ class InherentCategory(GlossElement):
     end = ')'
 
 
+@functools.lru_cache(maxsize=None)
+def _gloss_element_classes(type_) -> typing.Dict[str, type]:
+    """
+    Maps start markers to the `GlossElement` subclasses recognized in morphemes of type `type_`.
+
+    Since the subclasses are all defined in this module, the mapping is computed only once per
+    morpheme type.
+    """
+    classes = {GlossElement.start: GlossElement} if type_ == 'gloss' else {}
+    for cls in GlossElement.__subclasses__():
+        if (not cls.in_gloss_only) or type_ == 'gloss':
+            assert cls.start not in classes
+            classes[cls.start] = cls
+    return classes
+
+
 class GlossElements(list):
     """
     A container class for a list of `GlossElement` instances, together with functionality to
@@ -158,11 +207,7 @@ class GlossElements(list):
 
     @staticmethod
     def _iter_gloss_elements(s, type_):
-        classes = {GlossElement.start: GlossElement} if type_ == 'gloss' else {}
-        for cls in GlossElement.__subclasses__():
-            if (not cls.in_gloss_only) or type_ == 'gloss':
-                assert cls.start not in classes
-                classes[cls.start] = cls
+        classes = _gloss_element_classes(type_)
         e, cls = '', GlossElement
         s = list(reversed(s))
         while s:
@@ -198,6 +243,36 @@ class GlossElements(list):
         return cls(res)
 
 
+@functools.lru_cache(maxsize=4096)
+def _gloss_concepts(gloss: str) -> typing.Tuple[typing.Tuple[str, ...], typing.Tuple[str, ...]]:
+    """
+    Grammatical and lexical concepts of a morpheme gloss.
+
+    Since the same glosses recur throughout a corpus, results are memoized (as immutable tuples).
+    """
+    grammatical, lexical = [], []
+    gs, ls = '', ''
+    for ge in GlossElements._iter_gloss_elements(gloss, 'gloss'):
+        # We classify each gloss element only once.
+        is_label = ge.is_category_label
+        if isinstance(ge, (GlossElementAfterColon, GlossElementAfterSemicolon)):
+            # Something new is starting.
+            if gs:
+                grammatical.append(gs.replace('_', ' '))
+            if ls:
+                lexical.append(ls.replace('_', ' '))
+            gs, ls = (str(ge), '') if is_label else ('', str(ge))
+        elif is_label:
+            gs = gs + ge.start + str(ge) if gs else str(ge)
+        else:
+            ls = ls + ' ' + str(ge) if ls else str(ge)
+    if gs:
+        grammatical.append(gs.replace('_', ' '))
+    if ls:
+        lexical.append(ls.replace('_', ' '))
+    return tuple(grammatical), tuple(lexical)
+
+
 class Morpheme(str):
     """
     Rule 2. Morphemes are separated by "-".
@@ -264,9 +339,9 @@ class GlossedMorpheme(object):
             >>> gm.form
             'abc'
         """
-        return ''.join(
-            c for c in self.morpheme if
-            unicodedata.category(c) not in {'Po', 'Pf', 'Ps', 'Pd', 'Pe', 'Pi', 'Sm'})
+        s = str(self.morpheme)
+        # Morphemes consisting of letters and digits only cannot contain markup.
+        return s if s.isalnum() else s.translate(_MARKUP_TABLE)
 
     @property
     def first(self):
@@ -294,7 +369,7 @@ class GlossedMorpheme(object):
             >>> gm.grammatical_concepts
             ['ABC.DEF', 'GHI', 'JKL']
         """
-        return list(self._glosses('grammatical'))
+        return self.concepts[0]
 
     @property
     def lexical_concepts(self) -> typing.List[str]:
@@ -308,27 +383,23 @@ class GlossedMorpheme(object):
             >>> gm.lexical_concepts
             ['come out']
         """
-        return list(self._glosses('lexical'))
+        return self.concepts[1]
 
-    def _glosses(self, type_):
-        s = ''
-        for ge in self.gloss.elements:
-            if isinstance(ge, (GlossElementAfterColon, GlossElementAfterSemicolon)):
-                # Something new is starting.
-                if s:
-                    yield s.replace('_', ' ')
-                    s = ''
-                if (type_ == 'lexical' and not ge.is_category_label) or \
-                        (type_ == 'grammatical' and ge.is_category_label):
-                    s = str(ge)
-            else:
-                if (type_ == 'lexical' and not ge.is_category_label) or \
-                        (type_ == 'grammatical' and ge.is_category_label):
-                    if s:
-                        s += ge.start if ge.is_category_label else ' '
-                    s += str(ge)
-        if s:
-            yield s.replace('_', ' ')
+    @property
+    def concepts(self) -> typing.Tuple[typing.List[str], typing.List[str]]:
+        """
+        Grammatical and lexical concepts of the morpheme gloss, computed in one pass over the
+        gloss elements.
+
+        .. code-block:: python
+
+            >>> from pyigt.lgrmorphemes import GlossedMorpheme
+            >>> gm = GlossedMorpheme(morpheme='m', gloss='exist:REDUP:all', sep='-')
+            >>> gm.concepts
+            (['REDUP'], ['exist', 'all'])
+        """
+        grammatical, lexical = _gloss_concepts(str(self.gloss))
+        return list(grammatical), list(lexical)
 
 
 @attr.s(repr=False)
@@ -344,7 +415,7 @@ class GlossedWord(object):
     strict = attr.ib(default=False, eq=False)
 
     def __attrs_post_init__(self):
-        mm, gg = split_morphemes(self.word), split_morphemes(self.gloss)
+        mm, gg = _split_morphemes(self.word or ''), _split_morphemes(self.gloss or '')
         if len(mm) != len(gg):
             if self.strict:
                 raise ValueError(
@@ -355,7 +426,7 @@ class GlossedWord(object):
         for m, g in zip(mm, gg):
             if not m and not g:
                 continue  # Morpheme starts or ends with separator
-            if m in MORPHEME_SEPARATORS:
+            if m in _MORPHEME_SEPARATOR_SET:
                 if m != g:
                     if self.strict:
                         raise ValueError(
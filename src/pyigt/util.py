@@ -1,4 +1,5 @@
 import re
+import functools
 
 from clldutils.lgr import ABBRS, PERSONS, pattern
 
@@ -8,8 +9,9 @@ STANDARD_ABBR_PATTERN = pattern()
 GENERIC_ABBR_PATTERN = re.compile('^([A-Z][A-Z0-9]*|([1-3](DL|PL|SG|DU))|[1-3]/[1-3])$')
 
 
+@functools.lru_cache(maxsize=4096)
 def is_generic_abbr(label):
-    return bool((label in ABBRS) or GENERIC_ABBR_PATTERN.match(label))
+    return bool((label in ABBRS) or GENERIC_ABBR_PATTERN.fullmatch(label))
 
 
 def is_standard_abbr(label):
@@ -19,6 +21,7 @@ def is_standard_abbr(label):
     return False
 
 
+@functools.lru_cache(maxsize=4096)
 def expand_standard_abbr(label):
     match = STANDARD_ABBR_PATTERN.fullmatch(label)
     if match and not match.group('pre'):
@@ -1,3 +1,4 @@
+import csv
 import pathlib
 
 import pytest
@@ -39,6 +40,53 @@ def test_IGT_conformance():
     assert igt.conformance == LGRConformance.MORPHEME_ALIGNED
 
 
+def test_IGT_cached_properties():
+    igt = IGT(phrase='a b', gloss='A B')
+    assert igt.conformance == LGRConformance.MORPHEME_ALIGNED
+    assert igt.phrase_text == 'a b'
+    igt.gloss = ['A']
+    assert igt.conformance == LGRConformance.UNALIGNED
+    igt.phrase, igt.gloss = ['a-b'], ['A-B']
+    assert igt.conformance == LGRConformance.MORPHEME_ALIGNED
+    assert igt.phrase_text == 'a-b' and igt.primary_text == 'ab' and igt.gloss_text == 'A-B'
+    igt.strict = True
+    assert igt.glossed_words[0].strict
+
+    igt = IGT(phrase='a-b', gloss='a-XYZ')
+    assert igt.gloss_abbrs == {'XYZ': None}
+    igt.abbrs = {'XYZ': 'xyz'}
+    assert igt.gloss_abbrs == {'XYZ': 'xyz'}
+
+
+def test_IGT_conformance_reuses_glossed_words():
+    igt = IGT(phrase='a b-c', gloss='A B-C')
+    assert 'glossed_words' not in igt.__dict__
+    assert igt.conformance == LGRConformance.MORPHEME_ALIGNED
+    glossed_words = igt.__dict__['glossed_words']
+    assert igt.glossed_words is glossed_words
+    assert not any(gw.strict for gw in igt.glossed_words)
+
+    igt = IGT(phrase='a b-c', gloss='A B-C', strict=True)
+    assert igt.conformance == LGRConformance.MORPHEME_ALIGNED
+    assert all(gw.strict for gw in igt.glossed_words)
+
+    # Non-aligned IGTs do not fill the cache:
+    igt = IGT(phrase='a b-c', gloss='A B')
+    assert igt.conformance == LGRConformance.WORD_ALIGNED
+    assert 'glossed_words' not in igt.__dict__
+
+
+def test_IGT_check_strict(mocker):
+    igt = IGT(phrase='a b-c', gloss='A B-C')
+    assert igt.conformance == LGRConformance.MORPHEME_ALIGNED
+    # With the conformance level known, no words need to be parsed again:
+    mocker.patch('pyigt.igt.GlossedWord', side_effect=ValueError)
+    igt.check(strict=True)
+
+    with pytest.raises(ValueError):
+        IGT(phrase='a b-c', gloss='A B').check(strict=True)
+
+
 def test_IGT_primary_text():
     igt = IGT(phrase="a b-c", gloss='a b')
     assert igt.primary_text == "a bc"
@@ -61,6 +109,37 @@ def test_IGT_words():
     assert len(igt) != len(igt.as_prosodic())
     assert len(igt) != len(igt.as_morphosyntactic())
 
+    igt = IGT(phrase='a=bcd -e', gloss='a=bcd-e', translation="''quoted''")
+    assert igt.translation == "'quoted'"
+    assert igt.as_prosodic().translation == igt.translation
+    assert [gw.word for gw in igt.as_prosodic()] == ['a=bcd', 'e']
+
+
+def test_IGT_prosodic_words_misaligned():
+    for strict in (False, True):
+        igt = IGT(phrase='x a-b', gloss='X A', strict=strict)
+        assert [(gw.word, gw.gloss) for gw in igt.prosodic_words] == [('x', 'X'), ('a', 'A')]
+
+    igt = IGT(phrase=['a', None], gloss=['A', 'B'])
+    assert [gw.word for gw in igt.prosodic_words] == ['a']
+
+
+@pytest.mark.parametrize(
+    'phrase,words',
+    [
+        ('a -b -c', ['a -b -c']),
+        ('a - b', ['a -', 'b']),
+        ('a -', ['a -']),
+        ('a  -b', ['a', '-b']),
+        ('a --b', ['a --b']),
+        ('', []),
+    ]
+)
+def test_parse_phrase(phrase, words):
+    from pyigt.igt import parse_phrase
+
+    assert parse_phrase(phrase) == words
+
 
 def test_IGT_malformed():
     igt = IGT(phrase='a--b', gloss='A--B')
@@ -72,6 +151,18 @@ def test_Corpus_from_path(fixtures):
         Corpus.from_path(str(fixtures / 'examples.csv')))
 
 
+def test_Corpus_from_path_column_order(fixtures, tmp_path):
+    with fixtures.joinpath('examples.csv').open(encoding='utf8', newline='') as f:
+        rows = list(csv.reader(f))
+    # Reverse the order of the non-default columns:
+    rows = [row[:8] + row[8:][::-1] for row in rows]
+    with tmp_path.joinpath('examples.csv').open('w', encoding='utf8', newline='') as f:
+        csv.writer(f).writerows(rows)
+
+    corpus = Corpus.from_path(tmp_path / 'examples.csv')
+    assert list(corpus['1'].properties)[-3:] == ['Phrase_Number', 'Sentence_Number', 'Text_ID']
+
+
 def test_Corpus_iter(corpus):
     for igt in corpus:
         assert isinstance(igt, IGT)
@@ -94,6 +185,10 @@ def test_Corpus_get_stats(corpus):
     e, w, m = c.get_stats()
     assert e == 1 and w == 1 and m == 1
 
+    # Non-aligned IGTs in strict mode can be added to a corpus:
+    c = Corpus([IGT(id=1, phrase='x a-b', gloss='X A', strict=True)])
+    assert not c.grammar
+
 
 def test_Corpus_invalid_igts():
     c = Corpus([IGT(id=1, phrase='a b-c', gloss='a b--c')])
@@ -118,16 +213,25 @@ def test_Corpus_concordance_invalid():
     assert not c.grammar
 
 
-def test_Corpus_write_concordance(corpus, capsys):
+def test_Corpus_write_concordance(corpus, capsys, tmp_path):
     corpus.write_concordance('grammar')
     out, _ = capsys.readouterr()
     assert 'CAUS' in out
+    # Output is written to stdout as is, without trailing blank line:
+    assert out.startswith('ID\t') and out.splitlines()[-1]
+
+    corpus.write_concordance('grammar', filename=tmp_path / 'conc.tsv')
+    out2, _ = capsys.readouterr()
+    assert not out2
+    assert tmp_path.joinpath('conc.tsv').read_text(encoding='utf8').splitlines() == \
+        out.splitlines()
 
 
 def test_Corpus_write_concepts(corpus, capsys):
     corpus.write_concepts('lexicon')
     out, _ = capsys.readouterr()
     assert 'CAUS' in out
+    assert out.startswith('ID\t') and out.splitlines()[-1]
 
 
 @pytest.mark.parametrize(